@@ -1,5 +1,9 @@
 import sys
 import os
+import sqlite3
+import threading
+from base64 import b64decode
+from collections import OrderedDict, deque
 
 # Set the Qt plugin path for frozen applications
 if getattr(sys, 'frozen', False):
@@ -8,29 +12,57 @@ if getattr(sys, 'frozen', False):
     os.environ['QT_PLUGIN_PATH'] = plugin_path
 
 # Import PyQt5 modules
-from PyQt5.QtCore import Qt, QUrl, QTimer, QModelIndex, QSettings, QObject, pyqtSignal
-from PyQt5.QtGui import QIcon, QPixmap
+from PyQt5.QtCore import Qt, QUrl, QTimer, QModelIndex, QSettings, QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QIcon, QImage, QPixmap, QPixmapCache
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QAction, QWidget, QVBoxLayout, QHBoxLayout, QDockWidget, QTreeView,
     QFileDialog, QFileSystemModel, QPushButton, QSlider, QLabel, QStatusBar, QSystemTrayIcon, QMenu,
     QFrame, QListWidget, QListWidgetItem, QMessageBox, QShortcut
 )
 
+_BASE_PATH = sys._MEIPASS if getattr(sys, 'frozen', False) else os.path.dirname(__file__)
+_MEDIA_PATH = os.path.join(_BASE_PATH, 'media')
+_META_DB_PATH = os.path.join(os.path.expanduser('~'), '.orangplay', 'meta.db')
+
+def _find_vlc_dll_dir(vlc_base, required):
+    # breadth-first, so the shallow folder holding the DLLs is found before the plugin tree is listed
+    pending = deque([vlc_base])
+    while pending:
+        folder = pending.popleft()
+        files = set()
+        subdirs = []
+        try:
+            with os.scandir(folder) as it:
+                for entry in it:
+                    # like os.walk, don't follow links, so a looping junction can't recurse forever
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    else:
+                        files.add(entry.name)
+        except OSError:
+            continue
+        if required.issubset(files):
+            return folder
+        pending.extend(subdirs)
+    return None
+
 def setup_vlc_dependencies():
     if not sys.platform.startswith("win"):
         return
 
-    if getattr(sys, 'frozen', False):
-        base_path = sys._MEIPASS
-    else:
-        base_path = os.path.dirname(__file__)
-    vlc_base = os.path.join(base_path, "vlc")
+    vlc_base = os.path.join(_BASE_PATH, "vlc")
     required = {"libvlc.dll", "libvlccore.dll"}
-    dll_dir = None
-    for root, _, files in os.walk(vlc_base):
-        if required.issubset(files):
-            dll_dir = root
-            break
+    # Remember where the DLLs were, relative to vlc_base since a frozen exe unpacks to a new temp dir each run
+    settings = QSettings("InterJava", "Oranges")
+    cache_key = "vlcDllDir"
+    cached_dir = settings.value(cache_key, "", type=str)
+    # a cached folder that no longer holds both DLLs falls through to a fresh walk
+    if cached_dir and all(os.path.isfile(os.path.join(vlc_base, cached_dir, name)) for name in required):
+        dll_dir = os.path.normpath(os.path.join(vlc_base, cached_dir))
+    else:
+        dll_dir = _find_vlc_dll_dir(vlc_base, required)
+        if dll_dir:
+            settings.setValue(cache_key, os.path.relpath(dll_dir, vlc_base))
     if dll_dir:
         os.environ["PATH"] = dll_dir + os.pathsep + os.environ.get("PATH", "")
         print("Using bundled VLC in:", dll_dir)
@@ -42,8 +74,19 @@ import vlc
 
 try:
     from mutagen import File as MutagenFile
+    from mutagen.easymp4 import EasyMP4
+    from mutagen.flac import FLAC, Picture
+    from mutagen.mp3 import MP3, EasyMP3
+    from mutagen.mp4 import MP4
+    from mutagen.oggvorbis import OggVorbis
+    # format classes by extension, so Mutagen doesn't have to sniff the file
+    _TAG_LOADERS = {'.mp3': EasyMP3, '.m4a': EasyMP4, '.mp4': EasyMP4, '.flac': FLAC, '.ogg': OggVorbis}
+    _ARTWORK_LOADERS = {'.mp3': MP3, '.m4a': MP4, '.flac': FLAC, '.ogg': OggVorbis}
 except ImportError:
     MutagenFile = None
+    Picture = None
+    _TAG_LOADERS = {}
+    _ARTWORK_LOADERS = {}
 class VLCMediaPlayer(QObject):
     positionChanged = pyqtSignal(int)
     durationChanged = pyqtSignal(int)
@@ -53,39 +96,41 @@ class VLCMediaPlayer(QObject):
         super().__init__(parent)
         self.instance = vlc.Instance()  # Enable video
         self.player = self.instance.media_player_new()
+        if sys.platform == "win32":
+            self._set_win = self.player.set_hwnd
+        elif sys.platform == "darwin":
+            self._set_win = self.player.set_nsobject
+        else:
+            self._set_win = self.player.set_xwindow
         self._duration = 0
+        self._last_pos_sec = -1
         self._current_media = None
-        self.video_widget = video_widget
+        self.video_widget = None
+        # bound once here; only rebound when the widget changes (fullscreen)
+        self.set_video_widget(video_widget)
         self.poll_timer = QTimer(self)
         self.poll_timer.setInterval(500)
         self.poll_timer.timeout.connect(self._poll)
-        self.poll_timer.start()
+        # only runs while playing; seeks and stop() report their own position
+        self.mediaEnded.connect(self.poll_timer.stop)
         events = self.player.event_manager()
         events.event_attach(vlc.EventType.MediaPlayerEndReached, self._on_media_end)
 
     def set_video_widget(self, widget):
         self.video_widget = widget
         if widget:
-            win_id = int(widget.winId())
-            if sys.platform == "win32":
-                self.player.set_hwnd(win_id)
-            elif sys.platform == "darwin":
-                self.player.set_nsobject(win_id)
-            else:
-                self.player.set_xwindow(win_id)
+            self._set_win(int(widget.winId()))
 
     def set_media(self, file_path):
         media = self.instance.media_new(file_path)
         self.player.set_media(media)
         self._current_media = file_path
+        self._last_pos_sec = -1
+        # the new length arrives from _poll once libvlc knows it; drop the old one until then
+        if self._duration != 0:
+            self._duration = 0
+            self.durationChanged.emit(0)
         if self.video_widget:
-            win_id = int(self.video_widget.winId())
-            if sys.platform == "win32":
-                self.player.set_hwnd(win_id)
-            elif sys.platform == "darwin":
-                self.player.set_nsobject(win_id)
-            else:
-                self.player.set_xwindow(win_id)
             media.add_options(
                 'no-audio-time-stretch',  # No audio time stretching
                 'network-caching=1000',   # Network cache value
@@ -94,29 +139,41 @@ class VLCMediaPlayer(QObject):
 
     def _poll(self):
         duration = self.player.get_length()
-        if duration != self._duration:
+        # libvlc reports -1/0 until the file is demuxed; wait for the real length
+        if duration > 0 and duration != self._duration:
             self._duration = duration
             self.durationChanged.emit(duration)
-        pos = self.player.get_time()
-        self.positionChanged.emit(pos)
+        self._emit_position(max(self.player.get_time(), 0))
+
+    def _emit_position(self, pos):
+        # the UI only shows whole seconds, so don't repaint for sub-second moves
+        pos_sec = pos // 1000
+        if pos_sec != self._last_pos_sec:
+            self._last_pos_sec = pos_sec
+            self.positionChanged.emit(pos)
 
     def _on_media_end(self, event):
         self.mediaEnded.emit()
 
     def play(self):
         self.player.play()
+        self.poll_timer.start()
 
     def pause(self):
         self.player.pause()
+        self.poll_timer.stop()
 
     def stop(self):
         self.player.stop()
+        self.poll_timer.stop()
+        self._emit_position(0)
 
     def set_position(self, position):
         duration = self.get_duration()
         if duration > 0:
             fraction = position / duration
             self.player.set_position(fraction)
+            self._emit_position(int(position))
 
     def get_position(self):
         return self.player.get_time()
@@ -130,10 +187,305 @@ class VLCMediaPlayer(QObject):
     def is_playing(self):
         return self.player.is_playing()
 
+# Raw ID3 frames for files Mutagen has no easy wrapper for (e.g. WAV)
+_ID3_FRAMES = {
+    'title': ('TIT2',),
+    'artist': ('TPE1',),
+    'album': ('TALB',),
+    'date': ('TDRC', 'TYER'),
+    'tracknumber': ('TRCK',),
+}
+
+def _first_tag(tags, key):
+    values = tags.get(key)
+    if values is None:
+        for frame_id in _ID3_FRAMES.get(key, ()):
+            values = tags.get(frame_id)
+            if values is not None:
+                break
+    return str(values[0]) if values else None
+
+def _open_audio(file_path, loaders, easy=False):
+    loader = loaders.get(os.path.splitext(file_path)[1].lower())
+    if loader is not None:
+        try:
+            return loader(file_path)
+        except Exception:
+            pass  # mislabelled file, or e.g. Opus inside an .ogg; let Mutagen sniff it
+    return MutagenFile(file_path, easy=easy)
+
+def read_metadata(file_path):
+    meta = {
+        'title': None,
+        'artist': None,
+        'album': None,
+        'year': None,
+        'track': None
+    }
+    if MutagenFile is None:
+        return meta
+    try:
+        # the easy interfaces give every format the same title/artist/album/... keys
+        audio = _open_audio(file_path, _TAG_LOADERS, easy=True)
+        if not audio or not audio.tags:
+            return meta
+        meta['title'] = _first_tag(audio.tags, 'title')
+        meta['artist'] = _first_tag(audio.tags, 'artist')
+        meta['album'] = _first_tag(audio.tags, 'album')
+        meta['year'] = _first_tag(audio.tags, 'date')
+        track = _first_tag(audio.tags, 'tracknumber')
+        meta['track'] = track.split('/')[0].strip() if track else None
+    except Exception:
+        pass
+    return meta
+
+def _m4a_artwork(audio):
+    covers = audio.tags.get("covr")
+    return bytes(covers[0]) if covers else None
+
+def _flac_artwork(audio):
+    if audio.pictures:
+        return audio.pictures[0].data
+    return None
+
+def _decode_ogg_picture(block):
+    picture = Picture(b64decode(block))
+    return picture.data
+
+def _ogg_artwork(audio):
+    blocks = audio.tags.get("metadata_block_picture")
+    return _decode_ogg_picture(blocks[0]) if blocks else None
+
+def _id3_artwork(audio):
+    # APIC frames are keyed "APIC:<description>", so getall() instead of a prefix scan
+    if not hasattr(audio.tags, "getall"):
+        return None
+    pictures = audio.tags.getall("APIC")
+    return pictures[0].data if pictures else None
+
+_ARTWORK_READERS = {
+    '.m4a': _m4a_artwork,
+    '.flac': _flac_artwork,
+    '.ogg': _ogg_artwork,
+}
+
+def read_artwork(file_path):
+    if MutagenFile is None:
+        return None
+    ext = os.path.splitext(file_path)[1].lower()
+    try:
+        audio = _open_audio(file_path, _ARTWORK_LOADERS)
+        if not audio or not audio.tags:
+            return None
+        return _ARTWORK_READERS.get(ext, _id3_artwork)(audio)
+    except Exception:
+        return None
+
+_AUDIO_EXTS = frozenset({'.mp3', '.wav', '.ogg', '.flac', '.m4a'})
+_VIDEO_EXTS = frozenset({'.mp4', '.avi', '.mkv', '.webm', '.mov'})
+_MEDIA_EXTS = _AUDIO_EXTS | _VIDEO_EXTS
+
+def _set_artwork(meta, artwork):
+    meta['artwork'] = artwork
+    # tracks of one album usually embed the same cover, so the pixmap is cached by content
+    meta['artwork_key'] = f"art:{hash(artwork):x}" if artwork else None
+
+def add_artwork(file_path, meta):
+    _set_artwork(meta, read_artwork(file_path))
+    return meta
+
+_META_FIELDS = ('title', 'artist', 'album', 'year', 'track')
+
+class MetadataStore:
+    # One connection shared by the GUI and worker threads; sqlite3 objects are not thread-safe, hence the lock
+    def __init__(self, db_path):
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS meta (path TEXT PRIMARY KEY, mtime REAL, size INTEGER, "
+            "title TEXT, artist TEXT, album TEXT, year TEXT, track TEXT, artwork BLOB)"
+        )
+        self._conn.commit()
+
+    def load(self, file_path, include_artwork=False):
+        try:
+            st = os.stat(file_path)
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT mtime, size, title, artist, album, year, track, artwork FROM meta WHERE path = ?",
+                    (os.path.abspath(file_path),)
+                ).fetchone()
+        except (OSError, sqlite3.Error):
+            return None
+        # the row only counts if the file hasn't been retagged or replaced since
+        if row is None or row[0] != st.st_mtime or row[1] != st.st_size:
+            return None
+        meta = dict(zip(_META_FIELDS, row[2:7]))
+        # NULL means the cover was never read, an empty blob that the track has none
+        if include_artwork and row[7] is not None:
+            _set_artwork(meta, bytes(row[7]) or None)
+        return meta
+
+    def save(self, items):
+        rows = []
+        for file_path, meta in items:
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                continue
+            artwork = (meta.get('artwork') or b'') if 'artwork_key' in meta else None
+            rows.append((os.path.abspath(file_path), st.st_mtime, st.st_size,
+                         *(meta.get(field) for field in _META_FIELDS), artwork))
+        if not rows:
+            return
+        try:
+            with self._lock, self._conn:
+                # a text-only write keeps the stored cover as long as the file is unchanged
+                self._conn.executemany(
+                    "INSERT INTO meta (path, mtime, size, title, artist, album, year, track, artwork) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(path) DO UPDATE SET "
+                    "title = excluded.title, artist = excluded.artist, album = excluded.album, "
+                    "year = excluded.year, track = excluded.track, "
+                    "artwork = CASE WHEN excluded.artwork IS NULL AND mtime = excluded.mtime "
+                    "AND size = excluded.size THEN artwork ELSE excluded.artwork END, "
+                    "mtime = excluded.mtime, size = excluded.size",
+                    rows
+                )
+        except sqlite3.Error as e:
+            print(f"Error saving metadata cache: {e}")
+
+def load_metadata(file_path, store=None, include_artwork=False):
+    meta = store.load(file_path, include_artwork) if store is not None else None
+    if meta is not None and (not include_artwork or 'artwork_key' in meta):
+        return meta
+    if meta is None:
+        meta = read_metadata(file_path)
+    if include_artwork:
+        add_artwork(file_path, meta)
+    if store is not None:
+        store.save([(file_path, meta)])
+    return meta
+
+class FolderScannerSignals(QObject):
+    batchReady = pyqtSignal(list)
+    done = pyqtSignal(list)
+
+class FolderScanner(QRunnable):
+    BATCH_SIZE = 32
+
+    def __init__(self, folder_path, store=None):
+        super().__init__()
+        self.folder_path = folder_path
+        self.store = store
+        self.signals = FolderScannerSignals()
+
+    def run(self):
+        files = []
+        try:
+            # DirEntry.is_file() reuses the type info from the directory listing instead of a stat per entry
+            with os.scandir(self.folder_path) as it:
+                for entry in it:
+                    name = entry.name
+                    dot = name.rfind('.')
+                    # only the suffix is lowercased, and dotfiles like ".mp3" are not media
+                    if dot > 0 and name[dot:].lower() in _MEDIA_EXTS and entry.is_file():
+                        files.append(entry.path)
+        except OSError as e:
+            print(f"Error scanning folder {self.folder_path}: {e}")
+        files.sort()
+        batch = []
+        parsed = []
+        for file_path in files:
+            meta = self.store.load(file_path) if self.store is not None else None
+            if meta is None:
+                meta = read_metadata(file_path)
+                parsed.append((file_path, meta))
+            batch.append((file_path, meta))
+            if len(batch) >= self.BATCH_SIZE:
+                self._flush(batch, parsed)
+                batch = []
+                parsed = []
+        if batch:
+            self._flush(batch, parsed)
+        self.signals.done.emit(files)
+
+    def _flush(self, batch, parsed):
+        # one transaction per batch rather than one per file
+        if parsed and self.store is not None:
+            self.store.save(parsed)
+        self.signals.batchReady.emit(batch)
+
+class MetadataWorkerSignals(QObject):
+    loaded = pyqtSignal(str, dict)
+
+class MetadataWorker(QRunnable):
+    def __init__(self, file_path, include_artwork=True, store=None):
+        super().__init__()
+        self.file_path = file_path
+        self.include_artwork = include_artwork
+        self.store = store
+        self.signals = MetadataWorkerSignals()
+
+    def run(self):
+        meta = load_metadata(self.file_path, self.store, self.include_artwork)
+        self.signals.loaded.emit(self.file_path, meta)
+
+class ArtworkScalerSignals(QObject):
+    ready = pyqtSignal(str, QImage, bool)
+
+class ArtworkScaler(QRunnable):
+    # QImage can be decoded and scaled off the GUI thread; QPixmap cannot
+    def __init__(self, artwork_key, data, w, h, fast_only=False):
+        super().__init__()
+        self.artwork_key = artwork_key
+        self.data = data
+        self.w = w
+        self.h = h
+        self.fast_only = fast_only
+        self.signals = ArtworkScalerSignals()
+
+    def run(self):
+        image = QImage.fromData(self.data)
+        if not image.isNull():
+            if self.fast_only:
+                # prefetched covers aren't on screen yet; the smooth pass runs if the track is shown
+                image = image.scaled(self.w, self.h, Qt.KeepAspectRatio, Qt.FastTransformation)
+            else:
+                # big covers are first cut to twice the target with the cheap filter,
+                # so the smooth pass only runs over a small image
+                if image.width() > 2 * self.w or image.height() > 2 * self.h:
+                    image = image.scaled(2 * self.w, 2 * self.h, Qt.KeepAspectRatio, Qt.FastTransformation)
+                image = image.scaled(self.w, self.h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self.signals.ready.emit(self.artwork_key, image, self.fast_only)
+
+_ICON_FILES = {
+    'play': 'play.png',
+    'pause': 'pause.png',
+    'prev': 'prev.png',
+    'next': 'next.png',
+    'loop': 'loop.png',
+    'volume': 'volume.png',
+    'tray': 'tray.png',
+    'orange': 'orange.png',
+}
+_ICONS = {}
+
+def _load_icons():
+    # Needs a QApplication, so this runs when the main window is built rather than at import
+    for name, file_name in _ICON_FILES.items():
+        icon_path = os.path.join(_MEDIA_PATH, file_name)
+        if os.path.exists(icon_path):
+            _ICONS[name] = QIcon(icon_path)
+        else:
+            print(f"Icon file not found: {icon_path}")
+            _ICONS[name] = QIcon()
+
 def load_icon(icon_name):
-    icon_path = os.path.join(os.path.dirname(__file__), icon_name)
-    if getattr(sys, 'frozen', False):
-        icon_path = os.path.join(sys._MEIPASS, icon_name)
+    icon_path = os.path.join(_BASE_PATH, icon_name)
     if os.path.exists(icon_path):
         return QIcon(icon_path)
     return None
@@ -149,7 +501,7 @@ def loadStyle():
         except Exception as e:
             print(f"Error loading user CSS: {e}")
     else:
-        css_file_path = os.path.join(os.path.dirname(__file__), 'style.css')
+        css_file_path = os.path.join(_BASE_PATH, 'style.css')
         try:
             with open(css_file_path, 'r') as css_file:
                 stylesheet = css_file.read()
@@ -162,15 +514,37 @@ def loadStyle():
         else:
             print("No QApplication instance found. Stylesheet not applied.")
 
+_LOOP_TEXT = ("Off", "All", "One")
+
+def _ms_to_minsec(ms):
+    m, s = divmod(max(ms, 0) // 1000, 60)
+    return f"{m}:{s:02d}"
+
 class MusicPlayer(QMainWindow):
+    METADATA_CACHE_SIZE = 512
+
     def __init__(self):
         super().__init__()
+        self.settings = QSettings("InterJava", "Oranges")
+        self._close_to_tray = self.settings.value("closeToTray", False, type=bool)
         self.setWindowTitle("OrangPlayer")
         self.setWindowIcon(load_icon('orange.png'))
         self.setGeometry(100, 100, 1000, 600)
         self.always_on_top = False
+        self._os_description = None
         loadStyle()
-        self.setWindowIcon(self.get_app_icon())
+        if not _ICONS:
+            _load_icons()
+        self.setWindowIcon(_ICONS['orange'])
+        QPixmapCache.setCacheLimit(20480)  # KB
+        placeholder_path = os.path.join(_MEDIA_PATH, "albumartplaceholder.png")
+        self._placeholder_pixmap = None
+        if os.path.exists(placeholder_path):
+            pixmap = QPixmap(placeholder_path)
+            # the bundled placeholder is already 200x200; only oversized custom ones get scaled
+            if pixmap.width() > 200 or pixmap.height() > 200:
+                pixmap = pixmap.scaled(200, 200, Qt.KeepAspectRatio, Qt.FastTransformation)
+            self._placeholder_pixmap = pixmap
         self.init_ui()
         self.setup_main_ui()
         
@@ -188,40 +562,55 @@ class MusicPlayer(QMainWindow):
         self.sc_prev.setContext(Qt.ApplicationShortcut)
         self.sc_prev.activated.connect(self.previous_track)
 
-        # Optional: fullscreen toggle (F11 already works via keyPressEvent)
+        # Optional: fullscreen toggle on F and F11
         self.sc_full = QShortcut(Qt.Key_F, self)
         self.sc_full.setContext(Qt.ApplicationShortcut)
         self.sc_full.activated.connect(self.toggle_fullscreen_video)
 
+        self.sc_full_f11 = QShortcut(Qt.Key_F11, self)
+        self.sc_full_f11.setContext(Qt.ApplicationShortcut)
+        self.sc_full_f11.activated.connect(self.toggle_fullscreen_video)
+
         self.mediaPlayer = VLCMediaPlayer(self, video_widget=self.videoFrame)
-        self.mediaPlayer.set_volume(100)
+        self.mediaPlayer.set_volume(self.volumeSlider.value())
         self.current_index = 0
         app_context = {"main_window": self}
         self.loop_mode = 0
         self.shuffle = False
         self.folderAudioFiles = []
-        self.trackMetadata = {}
+        self._pathToIndex = {}
+        self._lastDisplayed = None
+        self._pendingMetadata = {}
+        self._pendingArtwork = {}  # artwork key -> fast_only of the queued scale
+        self._fastArtwork = set()  # keys whose cached pixmap only had the fast pass
+        # tag reads share one small pool so prefetching can't thrash the disk
+        self._metadataPool = QThreadPool(self)
+        self._metadataPool.setMaxThreadCount(2)
+        try:
+            self.metadataStore = MetadataStore(_META_DB_PATH)
+        except (OSError, sqlite3.Error) as e:
+            print(f"Metadata cache disabled: {e}")
+            self.metadataStore = None
+        self.trackMetadata = OrderedDict()  # LRU keyed by absolute path
+        self._position = 0
+        self._duration = 0
+        self._lastStatus = None
+        self._folderScanSignals = None
+        self._folderScanCount = 0
+        self._playlistStale = False
         self.setup_dock()
         self.setup_actions()
         self.setup_connections()
         self.updatePlaybackMode()
         self.setStatusBar(QStatusBar(self))
-        self.settings = QSettings("InterJava", "Oranges")
+        self.statusBar().messageChanged.connect(self._on_status_message_changed)
         self.setup_view_menu()
         self.trayIcon = None
         self.update_slider = True
-        self.videoFrame.hide()
-        self.artLabel.show()
-        self.titleLabel.show()
-        self.authorLabel.show()
-        self.albumLabel.show()
-        self.yearLabel.show()
+        self._lastMode = None
+        self.set_display_mode('empty')
         self.resetTrackInfo()
         self.statusBar().showMessage("Select a song to begin")
-        self.timer = QTimer(self)
-        self.timer.setInterval(1000)
-        self.timer.timeout.connect(self.update_position)
-        self.timer.start()
 
     def init_ui(self):
         main_widget = QWidget(self)
@@ -229,22 +618,6 @@ class MusicPlayer(QMainWindow):
         self.main_layout = QVBoxLayout(main_widget)
         main_widget.setLayout(self.main_layout)
 
-    def get_media_folder_path(self):
-        if getattr(sys, 'frozen', False):
-            base_path = sys._MEIPASS
-        else:
-            base_path = os.path.dirname(__file__)
-        return os.path.join(base_path, 'media')
-
-    def get_app_icon(self):
-        media_path = self.get_media_folder_path()
-        icon_path = os.path.join(media_path, 'orange.png')
-        if os.path.exists(icon_path):
-            return QIcon(icon_path)
-        else:
-            print(f"Icon file not found: {icon_path}")
-            return QIcon()
-
     def setup_dock(self):
         self.fileDock = QDockWidget("File Explorer", self)
         self.fileDock.setObjectName("FileExplorerDock")
@@ -260,13 +633,14 @@ class MusicPlayer(QMainWindow):
         self.playlistDock.setObjectName("PlaylistDock")
         self.playlistDock.setFeatures(QDockWidget.DockWidgetClosable | QDockWidget.DockWidgetMovable | QDockWidget.DockWidgetFloatable)
         self.playlistWidget = QListWidget()
+        # every row is one line of text, so skip measuring each item
+        self.playlistWidget.setUniformItemSizes(True)
         self.playlistWidget.itemDoubleClicked.connect(self.on_playlist_item_double_clicked)
         self.playlistDock.setWidget(self.playlistWidget)
         self.addDockWidget(Qt.RightDockWidgetArea, self.playlistDock)
         self.playlistDock.hide()
 
     def setup_main_ui(self):
-        media_path = self.get_media_folder_path()
         top_container = QWidget()
         top_layout = QHBoxLayout(top_container)
         top_layout.setContentsMargins(10, 10, 10, 10)
@@ -274,13 +648,7 @@ class MusicPlayer(QMainWindow):
         self.artLabel = QLabel()
         self.artLabel.setFixedSize(200, 200)
         self.artLabel.setAlignment(Qt.AlignCenter)
-        placeholder_path = os.path.join(media_path, "albumartplaceholder.png")
-        if os.path.exists(placeholder_path):
-            pm = QPixmap(placeholder_path).scaled(200, 200, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            self.artLabel.setPixmap(pm)
-        else:
-            self.artLabel.setText("No Art")
-            self.artLabel.setStyleSheet("border: 1px solid #999; color: gray;")
+        self.show_placeholder_art()
         top_layout.addWidget(self.artLabel, alignment=Qt.AlignTop)
         self.videoFrame = QFrame()
         self.videoFrame.setFixedSize(1280, 800)
@@ -318,28 +686,27 @@ class MusicPlayer(QMainWindow):
         media_controls_layout.setSpacing(15)
         media_controls_layout.setContentsMargins(0, 0, 0, 0)
         self.prevButton = QPushButton()
-        self.prevButton.setIcon(QIcon(os.path.join(media_path, "prev.png")))
+        self.prevButton.setIcon(_ICONS['prev'])
         self.prevButton.setToolTip("Previous")
         media_controls_layout.addWidget(self.prevButton)
         self.playButton = QPushButton()
-        self.play_icon = QIcon(os.path.join(media_path, "play.png"))
-        self.pause_icon = QIcon(os.path.join(media_path, "pause.png"))
+        self.play_icon = _ICONS['play']
+        self.pause_icon = _ICONS['pause']
         self.playButton.setIcon(self.play_icon)
         self.playButton.setToolTip("Play/Pause")
         media_controls_layout.addWidget(self.playButton)
         self.nextButton = QPushButton()
-        self.nextButton.setIcon(QIcon(os.path.join(media_path, "next.png")))
+        self.nextButton.setIcon(_ICONS['next'])
         self.nextButton.setToolTip("Next")
         media_controls_layout.addWidget(self.nextButton)
         self.loopButton = QPushButton("Off")
         self.loopButton.setToolTip("Loop")
-        self.loopButton.setIcon(QIcon(os.path.join(media_path, "loop.png")))
+        self.loopButton.setIcon(_ICONS['loop'])
         media_controls_layout.addWidget(self.loopButton)
         media_controls_layout.setAlignment(Qt.AlignCenter)
         controls_layout.addWidget(media_controls_widget, stretch=1, alignment=Qt.AlignCenter)
-        volume_icon = QIcon(os.path.join(media_path, "volume.png"))
         self.volumeLabel = QLabel()
-        self.volumeLabel.setPixmap(volume_icon.pixmap(24, 24))
+        self.volumeLabel.setPixmap(_ICONS['volume'].pixmap(24, 24))
         self.volumeSlider = QSlider(Qt.Horizontal)
         self.volumeSlider.setRange(0, 100)
         self.volumeSlider.setValue(100)
@@ -358,6 +725,8 @@ class MusicPlayer(QMainWindow):
         progress_layout.addWidget(self.timeRemainingLabel)
         bottom_layout.addLayout(progress_layout)
         self.main_layout.addWidget(bottom_container)
+        # everything in the central area; hidden while the video is fullscreen
+        self._central_sections = [top_container, bottom_container]
 
     def _enter_video_fullscreen(self):
         # remember original placement + what was visible
@@ -376,10 +745,9 @@ class MusicPlayer(QMainWindow):
         self.fileDock.hide()
         self.playlistDock.hide()
 
-        # hide everything except the actual video surface
-        for w in self.centralWidget().findChildren(QWidget):
-            if w is not self.videoFrame:
-                w.hide()
+        # hide the central area; the video surface is moved out of it below
+        for w in self._central_sections:
+            w.hide()
 
         # reparent the video widget to the window and stretch it
         self.videoFrame.setParent(self)
@@ -391,12 +759,7 @@ class MusicPlayer(QMainWindow):
 
         # rebind VLC to the new native window
         if self.mediaPlayer:
-            if sys.platform == "win32":
-                self.mediaPlayer.player.set_hwnd(int(self.videoFrame.winId()))
-            elif sys.platform == "darwin":
-                self.mediaPlayer.player.set_nsobject(int(self.videoFrame.winId()))
-            else:
-                self.mediaPlayer.player.set_xwindow(int(self.videoFrame.winId()))
+            self.mediaPlayer.set_video_widget(self.videoFrame)
 
 
     def _exit_video_fullscreen(self):
@@ -424,18 +787,17 @@ class MusicPlayer(QMainWindow):
             self.fileDock.setVisible(self._dock_vis.get("file", False))
             self.playlistDock.setVisible(self._dock_vis.get("playlist", False))
 
-        # 3) Re-show the entire central area (recursively), except the video surface
-        cw = self.centralWidget()
-        if cw:
-            for w in cw.findChildren(QWidget):  # recursive
-                if w is not self.videoFrame:
-                    w.show()
+        # 3) Re-show the central area; children keep their own visibility
+        for w in self._central_sections:
+            w.show()
 
         # 4) Rebind VLC to the restored video widget
         if self.mediaPlayer:
             self.mediaPlayer.set_video_widget(self.videoFrame)
 
         # 5) Let the normal logic hide/show art/labels depending on media type
+        #    (the video frame was shown above, so the remembered mode is stale)
+        self._lastMode = None
         self.updateTrackInfo()
 
         # 6) Cleanup temp attributes
@@ -452,34 +814,37 @@ class MusicPlayer(QMainWindow):
         self.authorLabel.setText("")
         self.albumLabel.setText("")
         self.yearLabel.setText("")
-        media_path = self.get_media_folder_path()
-        placeholder_path = os.path.join(media_path, "albumartplaceholder.png")
-        if os.path.exists(placeholder_path):
-            pixmap = QPixmap(placeholder_path).scaled(200, 200, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            self.artLabel.setPixmap(pixmap)
+        self.show_placeholder_art()
+        self._lastStatus = None
+        self._lastDisplayed = None
+        self.statusBar().showMessage("Select a song to begin")
+
+    def show_placeholder_art(self):
+        if self._placeholder_pixmap is not None:
+            self.artLabel.setPixmap(self._placeholder_pixmap)
         else:
             self.artLabel.setText("No Art")
             self.artLabel.setStyleSheet("border: 1px solid #999; color: gray;")
-        self.statusBar().showMessage("Select a song to begin")
 
     def on_playlist_item_double_clicked(self, item):
         index = self.playlistWidget.row(item)
         if 0 <= index < len(self.folderAudioFiles):
             self.current_index = index
-            current_volume = self.volumeSlider.value()
             self.mediaPlayer.set_media(self.folderAudioFiles[index])
-            self.mediaPlayer.set_video_widget(self.videoFrame)
             self.mediaPlayer.play()
-            self.mediaPlayer.set_volume(current_volume)
             self.playButton.setIcon(self.pause_icon)
             self.updateTrackInfo()
             self.update_playlist_selection()
 
     def update_playlist_selection(self):
+        if self.playlistWidget.currentRow() == self.current_index:
+            return
+        self.playlistWidget.blockSignals(True)
         self.playlistWidget.setCurrentRow(self.current_index)
+        self.playlistWidget.blockSignals(False)
 
-    def populate_playlist(self, files):
-        self.playlistWidget.clear()
+    def append_playlist_items(self, files):
+        items = []
         for file_path in files:
             meta = self.extractMetadata(file_path)
             display_text = os.path.basename(file_path)
@@ -490,28 +855,60 @@ class MusicPlayer(QMainWindow):
             
             item = QListWidgetItem(display_text)
             item.setToolTip(file_path) 
+            items.append(item)
+        # add the whole batch with one relayout/repaint at the end
+        self.playlistWidget.setUpdatesEnabled(False)
+        self.playlistWidget.blockSignals(True)
+        for item in items:
             self.playlistWidget.addItem(item)
+        self.playlistWidget.blockSignals(False)
+        self.playlistWidget.setUpdatesEnabled(True)
 
     def open_folder(self):
         folder_path = QFileDialog.getExistingDirectory(self, "Select Media Folder", "")
         if folder_path:
-            media_extensions = ('.mp3', '.wav', '.ogg', '.flac', '.m4a', '.mp4', '.avi', '.mkv', '.webm', '.mov')
-            files = []
-            for fname in os.listdir(folder_path):
-                fpath = os.path.join(folder_path, fname)
-                if os.path.isfile(fpath) and fpath.lower().endswith(media_extensions):
-                    files.append(fpath)
-            files.sort()
-            if files:
-                self.folderAudioFiles = files
-                self.current_index = 0
-                self.mediaPlayer.set_media(self.folderAudioFiles[0])
-                self.mediaPlayer.set_video_widget(self.videoFrame)
-                self.mediaPlayer.play()
-                self.populate_playlist(files)
-                self.playlistDock.show()
+            scanner = FolderScanner(folder_path, self.metadataStore)
+            scanner.signals.batchReady.connect(self.on_folder_batch_ready)
+            scanner.signals.done.connect(self.on_folder_scan_done)
+            self._folderScanSignals = scanner.signals
+            self._folderScanCount = 0
+            # The playlist only matches folderAudioFiles again once the scan is done
+            self.playlistWidget.setEnabled(False)
+            QThreadPool.globalInstance().start(scanner)
+
+    def on_folder_batch_ready(self, batch):
+        if self.sender() is not self._folderScanSignals:
+            return
+        if self._folderScanCount == 0:
+            self.playlistWidget.clear()
+            self.playlistDock.show()
+            # the rows no longer match folderAudioFiles until this scan's done() replaces it
+            self._playlistStale = True
+        for file_path, meta in batch:
+            self.cacheMetadata(file_path, meta)
+        self._folderScanCount += len(batch)
+        self.append_playlist_items([file_path for file_path, _ in batch])
+
+    def on_folder_scan_done(self, files):
+        if self.sender() is not self._folderScanSignals:
+            return
+        self._folderScanSignals = None
+        self.playlistWidget.setEnabled(True)
+        if not files:
+            if self._playlistStale:
+                # a superseded scan already replaced the rows; put the current playlist back
+                self.playlistWidget.clear()
+                self.append_playlist_items(self.folderAudioFiles)
                 self.update_playlist_selection()
-                self.updateTrackInfo()
+                self._playlistStale = False
+            return
+        self._playlistStale = False
+        self.set_playlist_files(files)
+        self.current_index = 0
+        self.mediaPlayer.set_media(self.folderAudioFiles[0])
+        self.mediaPlayer.play()
+        self.update_playlist_selection()
+        self.updateTrackInfo()
 
     def setup_view_menu(self):
         menu_bar = self.menuBar()
@@ -520,13 +917,18 @@ class MusicPlayer(QMainWindow):
         minimize_action.triggered.connect(self.minimize_to_tray)
         view_menu.addAction(minimize_action)
         self.minimizeOnCloseAction = QAction("Closing Window Minimizes to Tray", self, checkable=True)
-        self.minimizeOnCloseAction.setChecked(self.settings.value("closeToTray", False, type=bool))
-        self.minimizeOnCloseAction.toggled.connect(lambda checked: self.settings.setValue("closeToTray", checked))
+        self.minimizeOnCloseAction.setChecked(self._close_to_tray)
+        self.minimizeOnCloseAction.toggled.connect(self._on_close_to_tray_toggled)
         view_menu.addAction(self.minimizeOnCloseAction)
         fullscreen_action = QAction("Fullscreen Video", self)
         fullscreen_action.triggered.connect(self.toggle_fullscreen_video)
         view_menu.addAction(fullscreen_action)
 
+    def _on_close_to_tray_toggled(self, checked):
+        self._close_to_tray = checked
+        # write after the menu has closed instead of inside the toggle
+        QTimer.singleShot(0, lambda: self.settings.setValue("closeToTray", self._close_to_tray))
+
     def toggle_fullscreen_video(self):
         if self.videoFrame.isVisible():
             if not self.isFullScreen():
@@ -535,17 +937,8 @@ class MusicPlayer(QMainWindow):
                 self._exit_video_fullscreen()
 
     def keyPressEvent(self, event):
-        if event.key() == Qt.Key_Space:
-            if self.folderAudioFiles:
-                self.play_pause()
-                event.accept()
-                return
-        elif event.key() == Qt.Key_F11:
-            if self.videoFrame.isVisible():
-                self.toggle_fullscreen_video()
-                event.accept()
-                return
-        elif event.key() == Qt.Key_Escape:
+        # Space and F/F11 are handled by the QShortcuts set up in __init__
+        if event.key() == Qt.Key_Escape:
             if self.isFullScreen():
                 self._exit_video_fullscreen()
                 event.accept()
@@ -553,10 +946,6 @@ class MusicPlayer(QMainWindow):
         super().keyPressEvent(event)
 
     def create_tray_icon(self):
-        media_path = self.get_media_folder_path()
-        tray_icon_path = os.path.join(media_path, 'tray.png')
-        if not os.path.exists(tray_icon_path):
-            print(f"Tray icon file not found: {tray_icon_path}")
         title = "OrangPlayer"
         artist = None
         album = None
@@ -566,7 +955,7 @@ class MusicPlayer(QMainWindow):
             title = meta.get('title') or os.path.basename(current_file)
             artist = meta.get('artist') or None
             album = meta.get('album') or None
-        self.trayIcon = QSystemTrayIcon(QIcon(tray_icon_path), self)
+        self.trayIcon = QSystemTrayIcon(_ICONS['tray'], self)
         self.trayMenu = QMenu()
         self.trayPlayPauseAction = QAction("Play/Pause", self)
         self.trayPlayPauseAction.triggered.connect(self.play_pause)
@@ -605,7 +994,7 @@ class MusicPlayer(QMainWindow):
             self.trayIcon = None
 
     def closeEvent(self, event):
-        if self.minimizeOnCloseAction.isChecked():
+        if self._close_to_tray:
             if self.trayIcon is None:
                 event.ignore()
                 self.minimize_to_tray()
@@ -614,27 +1003,31 @@ class MusicPlayer(QMainWindow):
         else:
             event.accept()
 
+    def get_os_description(self):
+        if self._os_description is None:
+            if sys.platform == "win32":
+                build_number = sys.getwindowsversion().build
+                if build_number >= 22000:
+                    windows_version = "Windows 11"
+                elif build_number >= 10240:
+                    windows_version = "Windows 10"
+                elif build_number >= 9600:
+                    windows_version = "Windows 8.1"
+                elif build_number >= 9200:
+                    windows_version = "Windows 8"
+                elif build_number >= 7601:
+                    windows_version = "Windows 7"
+                else:
+                    windows_version = "Windows Vista"
+                self._os_description = f"{windows_version} (Build {build_number})"
+            else:
+                import platform
+                self._os_description = f"{platform.system()} {platform.release()}"
+        return self._os_description
+
     def show_about_dialog(self):
-        import platform
-        win_ver = platform.version()
-        version_number = int(win_ver.split('.')[0])
-        build_number = int(win_ver.split('.')[2])
-        
-        if build_number >= 22000:
-            windows_version = "Windows 11"
-        elif build_number >= 10240:
-            windows_version = "Windows 10"
-        elif build_number >= 9600:
-            windows_version = "Windows 8.1"
-        elif build_number >= 9200:
-            windows_version = "Windows 8"
-        elif build_number >= 7601:
-            windows_version = "Windows 7"
-        else:
-            windows_version = "Windows Vista"
-            
         about_text = f"""OrangPlayer
-Operating System: {windows_version} (Build {build_number})
+Operating System: {self.get_os_description()}
 Copyright © 2025 InterJava Projects
 Made by adasjusk"""
         QMessageBox.about(self, "About OrangPlayer", about_text)
@@ -681,10 +1074,8 @@ Made by adasjusk"""
 
     def handle_media_ended(self):
         if self.loop_mode == 2:
-            current_volume = self.volumeSlider.value()
             self.mediaPlayer.set_media(self.folderAudioFiles[self.current_index])
             self.mediaPlayer.play()
-            self.mediaPlayer.set_volume(current_volume)
         else:
             self.current_index += 1
             if self.current_index >= len(self.folderAudioFiles):
@@ -695,184 +1086,226 @@ Made by adasjusk"""
                     self.mediaPlayer.stop()
                     self.playButton.setIcon(self.play_icon)
                     return
-            current_volume = self.volumeSlider.value()
             self.mediaPlayer.set_media(self.folderAudioFiles[self.current_index])
             self.mediaPlayer.play()
-            self.mediaPlayer.set_volume(current_volume)
         self.updateTrackInfo()
 
     def extractMetadata(self, file_path):
-        if MutagenFile is None:
-            return {
-                'title': None,
-                'artist': None,
-                'album': None,
-                'year': None,
-                'artwork': None,
-                'track': None
-            }
-        try:
-            audio = MutagenFile(file_path)
-            if not audio or not audio.tags:
-                return {
-                    'title': None,
-                    'artist': None,
-                    'album': None,
-                    'year': None,
-                    'artwork': None,
-                    'track': None
-                }
-            title, artist, album, year, artwork_data, track = None, None, None, None, None, None
-            if file_path.lower().endswith('.m4a'):
-                title = audio.tags.get("©nam", [None])[0]
-                artist = audio.tags.get("©ART", [None])[0]
-                album = audio.tags.get("©alb", [None])[0]
-                year = audio.tags.get("©day", [None])[0]
-                track_info = audio.tags.get("trkn", [(None, None)])[0]
-                track = track_info[0] if track_info else None
-                if "covr" in audio.tags:
-                    for cover in audio.tags["covr"]:
-                        artwork_data = cover
-            elif file_path.lower().endswith('.flac'):
-                title = audio.get('title', [None])[0] if 'title' in audio else None
-                artist = audio.get('artist', [None])[0] if 'artist' in audio else None
-                album = audio.get('album', [None])[0] if 'album' in audio else None
-                year = audio.get('date', [None])[0] if 'date' in audio else None
-                track = audio.get('tracknumber', [None])[0] if 'tracknumber' in audio else None
-                
-                if audio.pictures:
-                    artwork_data = audio.pictures[0].data
-            elif file_path.lower().endswith('.ogg'):
-                for tag in audio.tags.keys():
-                    if tag == "title":
-                        title = audio.tags[tag][0]
-                    elif tag == "artist":
-                        artist = audio.tags[tag][0]
-                    elif tag == "album":
-                        album = audio.tags[tag][0]
-                    elif tag == "date":
-                        year = audio.tags[tag][0]
-                    elif tag == "metadata_block_picture":
-                        from mutagen.flac import Picture
-                        import base64
-                        data = base64.b64decode(audio.tags[tag][0])
-                        picture = Picture(data)
-                        artwork_data = picture.data
-                    elif tag == "tracknumber":
-                        track = audio.tags[tag][0]
-            else:
-                for tag in audio.tags.keys():
-                    if tag.startswith('TIT2'):
-                        title = str(audio.tags[tag])
-                    elif tag.startswith('TPE1'):
-                        artist = str(audio.tags[tag])
-                    elif tag.startswith('TALB'):
-                        album = str(audio.tags[tag])
-                    elif tag.startswith('TDRC') or tag.startswith('TYER'):
-                        year = str(audio.tags[tag])
-                    elif tag.startswith('APIC'):
-                        artwork_data = audio.tags[tag].data
-                    elif tag.startswith('TRCK'):
-                        try:
-                            track_str = str(audio.tags[tag])
-                            track = track_str.split('/')[0].strip()
-                        except Exception:
-                            track = None
-            return {
-                'title': title,
-                'artist': artist,
-                'album': album,
-                'year': year,
-                'artwork': artwork_data,
-                'track': track
-            }
-        except Exception:
-            return {
-                'title': None,
-                'artist': None,
-                'album': None,
-                'year': None,
-                'artwork': None,
-                'track': None
-            }
+        # tags only; covers are read by MetadataWorker so they never load on the GUI thread
+        meta = self.cachedMetadata(file_path)
+        if meta is None:
+            # misses are parsed here but only persisted by the workers, to keep writes off the GUI thread
+            meta = self.metadataStore.load(file_path) if self.metadataStore else None
+            if meta is None:
+                meta = read_metadata(file_path)
+            self.cacheMetadata(file_path, meta)
+        return meta
+
+    def cachedMetadata(self, file_path):
+        key = os.path.abspath(file_path)
+        meta = self.trackMetadata.get(key)
+        if meta is not None:
+            self.trackMetadata.move_to_end(key)
+        return meta
+
+    def cacheMetadata(self, file_path, meta):
+        key = os.path.abspath(file_path)
+        self.trackMetadata[key] = meta
+        self.trackMetadata.move_to_end(key)
+        if len(self.trackMetadata) > self.METADATA_CACHE_SIZE:
+            self.trackMetadata.popitem(last=False)
+
+    def request_metadata(self, file_path, include_artwork=True, priority=0):
+        pending = self._pendingMetadata.get(file_path)
+        if pending is not None:
+            queued, queued_priority = pending
+            # a prefetch still waiting in the queue is pulled out and resubmitted ahead of the others
+            if priority <= queued_priority or not self._metadataPool.tryTake(queued):
+                return
+        worker = MetadataWorker(file_path, include_artwork, self.metadataStore)
+        # kept alive by _pendingMetadata so tryTake() never touches a deleted runnable
+        worker.setAutoDelete(False)
+        worker.signals.loaded.connect(self.on_metadata_loaded)
+        self._pendingMetadata[file_path] = (worker, priority)
+        self._metadataPool.start(worker, priority)
+
+    def _prefetch(self, index):
+        if not self.folderAudioFiles:
+            return
+        file_path = self.folderAudioFiles[index % len(self.folderAudioFiles)]
+        is_video = os.path.splitext(file_path)[1].lower() in _VIDEO_EXTS
+        meta = self.trackMetadata.get(os.path.abspath(file_path))
+        # the cover is scaled as soon as it is read, so only tracks never read need fetching
+        if meta is None or (not is_video and 'artwork_key' not in meta):
+            self.request_metadata(file_path, include_artwork=not is_video, priority=-1)
+
+    def on_metadata_loaded(self, file_path, meta):
+        self._pendingMetadata.pop(file_path, None)
+        cached = self.trackMetadata.get(os.path.abspath(file_path))
+        if cached is not None and 'artwork_key' in cached and 'artwork_key' not in meta:
+            meta['artwork_key'] = cached['artwork_key']
+            if 'artwork' in cached:
+                meta['artwork'] = cached['artwork']
+        current_file = self.folderAudioFiles[self.current_index] if self.folderAudioFiles else None
+        if file_path != current_file or not self._needs_smooth_artwork(meta):
+            # Prefetched neighbours keep only the key, so the cache never holds more than one raw cover.
+            # Their cover gets the fast pass now so showing the track finds a pixmap ready.
+            data = meta.pop('artwork', None)
+            if data and self._artwork_pixmap(meta) is None:
+                self._scale_artwork(meta['artwork_key'], data, fast_only=True)
+        self.cacheMetadata(file_path, meta)
+        if file_path == current_file:
+            # the tags may have changed, so force a re-render
+            self._lastDisplayed = None
+            self.updateTrackInfo()
 
     def updateTrackInfo(self):
         current_file = self.folderAudioFiles[self.current_index] if self.folderAudioFiles else None
-        video_exts = ('.mp4', '.avi', '.mkv', '.webm', '.mov')
-        is_video = current_file and current_file.lower().endswith(video_exts)
+        is_video = current_file and os.path.splitext(current_file)[1].lower() in _VIDEO_EXTS
         if not current_file:
-            self.videoFrame.hide()
-            self.artLabel.show()
-            self.titleLabel.show()
-            self.authorLabel.show()
-            self.albumLabel.show()
-            self.yearLabel.show()
+            self.set_display_mode('empty')
             self.resetTrackInfo()
             return
-        if is_video:
-            self.videoFrame.show()
-            self.artLabel.hide()
-            self.titleLabel.hide()
-            self.authorLabel.hide()
-            self.albumLabel.hide()
-            self.yearLabel.hide()
+        self.set_display_mode('video' if is_video else 'audio')
+        # e.g. wrapping around a single-track playlist: the labels already show this track
+        displayed = (self.current_index, current_file)
+        if displayed == self._lastDisplayed and os.path.abspath(current_file) in self.trackMetadata:
+            return
+        meta = self.cachedMetadata(current_file)
+        pixmap = None if is_video else self._artwork_pixmap(meta)
+        if meta is None or (not is_video and self._needs_artwork_read(meta)):
+            # Parse off the GUI thread; on_metadata_loaded calls back in here when done.
+            # Until then the file name stands in for the title.
+            self.request_metadata(current_file, include_artwork=not is_video)
+        if meta is None:
+            meta = {}
         else:
-            self.videoFrame.hide()
-            self.artLabel.show()
-            self.titleLabel.show()
-            self.authorLabel.show()
-            self.albumLabel.show()
-            self.yearLabel.show()
-        meta = self.extractMetadata(current_file)
-        self.trackMetadata[self.current_index] = meta
+            # warm the cache for the likely next/previous click
+            index = self.current_index
+            QTimer.singleShot(0, lambda: self._prefetch(index + 1))
+            QTimer.singleShot(0, lambda: self._prefetch(index - 1))
         title = meta.get('title') or os.path.basename(current_file)
         artist = meta.get('artist') or "Unknown Artist"
         album = meta.get('album') or "Unknown Album"
         year = meta.get('year') or ""
-        artwork_data = meta.get('artwork')
         if not is_video:
+            # repaint the labels and art once, not once per setter
+            central = self.centralWidget()
+            central.setUpdatesEnabled(False)
             self.titleLabel.setText(title)
             self.authorLabel.setText(artist)
             self.albumLabel.setText(album)
             self.yearLabel.setText(year)
-            if artwork_data:
-                pixmap = QPixmap()
-                pixmap.loadFromData(artwork_data)
-                pixmap = pixmap.scaled(200, 200, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            if pixmap is not None:
                 self.artLabel.setPixmap(pixmap)
             else:
-                media_path = self.get_media_folder_path()
-                placeholder_path = os.path.join(media_path, "albumartplaceholder.png")
-                if os.path.exists(placeholder_path):
-                    pixmap = QPixmap(placeholder_path).scaled(200, 200, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                    self.artLabel.setPixmap(pixmap)
-                else:
-                    self.artLabel.setText("No Art")
-                    self.artLabel.setStyleSheet("border: 1px solid #999; color: gray;")
+                self.show_placeholder_art()
+            if meta.get('artwork') and self._needs_smooth_artwork(meta):
+                self._scale_artwork(meta['artwork_key'], meta['artwork'])
+            central.setUpdatesEnabled(True)
         self.update_status_bar()
         if self.trayIcon:
             tooltipStr = ("{} - ".format(artist) if artist else "") + title + ("\nAlbum: {}".format(album) if album else "")
-            self.trayIcon.setToolTip(tooltipStr)
+            if tooltipStr != self.trayIcon.toolTip():
+                self.trayIcon.setToolTip(tooltipStr)
+        self._lastDisplayed = displayed
+
+    def set_display_mode(self, mode):
+        # consecutive tracks are usually the same kind, so skip the relayout when nothing changes
+        if mode == self._lastMode:
+            return
+        self._lastMode = mode
+        is_video = mode == 'video'
+        self.videoFrame.setVisible(is_video)
+        self.artLabel.setVisible(not is_video)
+        self.titleLabel.setVisible(not is_video)
+        self.authorLabel.setVisible(not is_video)
+        self.albumLabel.setVisible(not is_video)
+        self.yearLabel.setVisible(not is_video)
+
+    def _cached_pixmap(self, key, w, h):
+        pixmap = QPixmapCache.find(f"{key}@{w}x{h}")
+        if pixmap is None or pixmap.isNull():
+            return None
+        return pixmap
+
+    def _artwork_pixmap(self, meta):
+        artwork_key = meta.get('artwork_key') if meta else None
+        return self._cached_pixmap(artwork_key, 200, 200) if artwork_key else None
+
+    def _needs_artwork_read(self, meta):
+        # never read, or the bytes were dropped and only a prefetch pixmap (or none) is left
+        if 'artwork_key' not in meta:
+            return True
+        return bool(meta['artwork_key']) and 'artwork' not in meta and self._needs_smooth_artwork(meta)
+
+    def _needs_smooth_artwork(self, meta):
+        # no pixmap yet, or only the fast one from a prefetch
+        return self._artwork_pixmap(meta) is None or meta['artwork_key'] in self._fastArtwork
+
+    def _scale_artwork(self, artwork_key, data, fast_only=False):
+        pending = self._pendingArtwork.get(artwork_key)
+        # a queued smooth pass covers any request; a queued fast one only covers another prefetch
+        if pending is not None and (fast_only or not pending):
+            return
+        self._pendingArtwork[artwork_key] = fast_only
+        scaler = ArtworkScaler(artwork_key, data, 200, 200, fast_only)
+        scaler.signals.ready.connect(self.on_artwork_scaled)
+        QThreadPool.globalInstance().start(scaler)
+
+    def on_artwork_scaled(self, artwork_key, image, fast_only):
+        if self._pendingArtwork.get(artwork_key) == fast_only:
+            del self._pendingArtwork[artwork_key]
+        elif fast_only:
+            # a smooth pass for the same cover was queued after this one; let it win
+            return
+        pixmap = None
+        if not image.isNull():
+            pixmap = QPixmap.fromImage(image)
+            QPixmapCache.insert(f"{artwork_key}@200x200", pixmap)
+            if fast_only:
+                self._fastArtwork.add(artwork_key)
+            else:
+                self._fastArtwork.discard(artwork_key)
+        # Only the 200x200 pixmap is shown, so every track sharing this cover drops its bytes.
+        # Undecodable art is forgotten so it isn't retried on every refresh.
+        for meta in self.trackMetadata.values():
+            if meta.get('artwork_key') == artwork_key:
+                meta.pop('artwork', None)
+                if pixmap is None:
+                    meta['artwork_key'] = None
+        if pixmap is None:
+            return
+        current_file = self.folderAudioFiles[self.current_index] if self.folderAudioFiles else None
+        meta = self.trackMetadata.get(os.path.abspath(current_file)) if current_file else None
+        if meta is not None and meta.get('artwork_key') == artwork_key and not self.artLabel.isHidden():
+            self.artLabel.setPixmap(pixmap)
+            if fast_only:
+                # the track came on screen while its prefetch was scaling; re-read it for the smooth pass
+                self.request_metadata(current_file)
 
     def onFileTreeDoubleClicked(self, index):
         file_path = self.fileModel.filePath(index)
-        if os.path.isfile(file_path) and file_path.lower().endswith(('.mp3', '.wav', '.ogg', '.flac', '.m4a')):
-            try:
-                idx = self.folderAudioFiles.index(file_path)
-            except ValueError:
+        if os.path.isfile(file_path) and os.path.splitext(file_path)[1].lower() in _AUDIO_EXTS:
+            key = os.path.abspath(file_path)
+            idx = self._pathToIndex.get(key)
+            if idx is None:
                 idx = len(self.folderAudioFiles)
                 self.folderAudioFiles.append(file_path)
+                self._pathToIndex[key] = idx
             self.current_index = idx
             if self.mediaPlayer:
-                current_volume = self.volumeSlider.value()
-                self.mediaPlayer.set_media(file_path)
+                # the list's spelling, so play_pause() recognises it as the loaded media
+                self.mediaPlayer.set_media(self.folderAudioFiles[idx])
                 self.mediaPlayer.play()
-                self.mediaPlayer.set_volume(current_volume)
             self.playButton.setIcon(self.pause_icon)
-            meta = self.extractMetadata(file_path)
-            self.trackMetadata[idx] = meta
             self.updateTrackInfo()
 
+    def set_playlist_files(self, files):
+        self.folderAudioFiles = files
+        # normalised like the metadata cache, since the file tree and the scanner spell paths differently
+        self._pathToIndex = {os.path.abspath(path): i for i, path in enumerate(files)}
+
     def open_file(self):
         file_path, _ = QFileDialog.getOpenFileName(
             self,
@@ -883,13 +1316,10 @@ Made by adasjusk"""
         if not file_path:
             return
         
-        self.folderAudioFiles = [file_path]
+        self.set_playlist_files([file_path])
         self.current_index = 0
-        current_volume = self.volumeSlider.value()
         self.mediaPlayer.set_media(file_path)
-        self.mediaPlayer.set_video_widget(self.videoFrame)
         self.mediaPlayer.play()
-        self.mediaPlayer.set_volume(current_volume)
         self.playButton.setIcon(self.pause_icon)
         self.updateTrackInfo()
 
@@ -910,10 +1340,8 @@ Made by adasjusk"""
         if self.folderAudioFiles and self.mediaPlayer:
             self.current_index = (self.current_index + 1) % len(self.folderAudioFiles)
             next_file = self.folderAudioFiles[self.current_index]
-            current_volume = self.volumeSlider.value()
             self.mediaPlayer.set_media(next_file)
             self.mediaPlayer.play()
-            self.mediaPlayer.set_volume(current_volume)
             self.playButton.setIcon(self.pause_icon)
             self.update_playlist_selection()
             self.updateTrackInfo()
@@ -922,10 +1350,8 @@ Made by adasjusk"""
         if self.folderAudioFiles and self.mediaPlayer:
             self.current_index = (self.current_index - 1) % len(self.folderAudioFiles)
             prev_file = self.folderAudioFiles[self.current_index]
-            current_volume = self.volumeSlider.value()
             self.mediaPlayer.set_media(prev_file)
             self.mediaPlayer.play()
-            self.mediaPlayer.set_volume(current_volume)
             self.playButton.setIcon(self.pause_icon)
             self.update_playlist_selection()
             self.updateTrackInfo()
@@ -933,41 +1359,30 @@ Made by adasjusk"""
     def toggle_loop(self):
         self.loop_mode = (self.loop_mode + 1) % 3
         self.updatePlaybackMode()
+        # nothing polls while paused, so refresh the loop shown in the status bar here
+        self.update_status_bar()
 
     def updatePlaybackMode(self):
-        loop_text = {0: "Off", 1: "All", 2: "One"}[self.loop_mode]
-        self.loopButton.setText(loop_text)
+        self.loopButton.setText(_LOOP_TEXT[self.loop_mode])
 
+    # position/duration come from the player's signals; no extra libvlc queries here
     def on_position_changed(self, position):
+        self._position = position
         if self.update_slider:
             self.positionSlider.setValue(position)
-            if self.mediaPlayer:
-                self.update_time_labels(position, self.mediaPlayer.get_duration())
+            self.update_time_labels(position, self._duration)
+        self.update_status_bar()
 
     def on_duration_changed(self, duration):
+        self._duration = duration
         self.positionSlider.setRange(0, duration)
-        if self.mediaPlayer:
-            self.update_time_labels(self.mediaPlayer.get_position(), duration)
-
-    def update_position(self):
-        if self.mediaPlayer:
-            pos = self.mediaPlayer.get_position()
-            if self.update_slider:
-                self.positionSlider.setValue(pos)
-            self.update_time_labels(pos, self.mediaPlayer.get_duration())
+        self.update_time_labels(self._position, duration)
         self.update_status_bar()
 
     def update_time_labels(self, position, duration):
-        def ms_to_minsec(ms):
-            ms = max(ms, 0)
-            s = ms // 1000
-            m = s // 60
-            s = s % 60
-            return f"{m}:{s:02d}"
-
-        self.timeElapsedLabel.setText(ms_to_minsec(position))
+        self.timeElapsedLabel.setText(_ms_to_minsec(position))
         if duration > 0:
-            self.timeRemainingLabel.setText(ms_to_minsec(duration))
+            self.timeRemainingLabel.setText(_ms_to_minsec(duration))
         else:
             self.timeRemainingLabel.setText("0:00")
 
@@ -975,29 +1390,33 @@ Made by adasjusk"""
         if self.mediaPlayer:
             self.mediaPlayer.set_position(position)
 
+    def _on_status_message_changed(self, message):
+        # Qt clears the bar after a status tip; put the now-playing line back even while paused
+        if not message:
+            self._lastStatus = None
+            self.update_status_bar()
+
     def update_status_bar(self):
         if not self.folderAudioFiles:
+            self._lastStatus = None
             self.statusBar().showMessage("Select Media File to play")
             return
         file_path = self.folderAudioFiles[self.current_index] if self.current_index < len(self.folderAudioFiles) else ""
-        meta = self.trackMetadata.get(self.current_index, {})
+        meta = self.trackMetadata.get(os.path.abspath(file_path), {}) if file_path else {}
         title = meta.get('title') or (os.path.basename(file_path) if file_path else "Unknown")
         artist = meta.get('artist') or "Unknown Artist"
         album = meta.get('album') or "Unknown Album"
-        def ms_to_minsec(ms):
-            ms = max(ms, 0)
-            s = ms // 1000
-            m = s // 60
-            s = s % 60
-            return f"{m}:{s:02d}"
-        duration = self.mediaPlayer.get_duration() if self.mediaPlayer else 0
-        duration_str = ms_to_minsec(duration) if duration > 0 else "0:00"
-        position = self.mediaPlayer.get_position() if self.mediaPlayer else 0
-        position_str = ms_to_minsec(position)
-        loop_text = {0: "Loop: Off", 1: "Loop: All", 2: "Loop: One"}[self.loop_mode]
+        # the message only shows whole seconds; skip formatting when nothing visible changed
+        status = (title, artist, album, self._duration // 1000, self._position // 1000, self.loop_mode)
+        if status == self._lastStatus:
+            return
+        self._lastStatus = status
+        duration = self._duration
+        duration_str = _ms_to_minsec(duration) if duration > 0 else "0:00"
+        position_str = _ms_to_minsec(self._position)
         message = (
             f"Now Playing: {title} - {artist} | Album: {album} | "
-            f"Duration: {duration_str} | Position: {position_str} | {loop_text}"
+            f"Duration: {duration_str} | Position: {position_str} | Loop: {_LOOP_TEXT[self.loop_mode]}"
         )
         self.statusBar().showMessage(message)
 
@@ -1006,8 +1425,8 @@ if __name__ == '__main__':
     player = MusicPlayer()
     if len(sys.argv) > 1:
         file_arg = sys.argv[1]
-        if os.path.isfile(file_arg) and file_arg.lower().endswith(('.mp3', '.wav', '.ogg', '.flac', '.m4a')):
-            player.folderAudioFiles = [file_arg]
+        if os.path.isfile(file_arg) and os.path.splitext(file_arg)[1].lower() in _AUDIO_EXTS:
+            player.set_playlist_files([file_arg])
             player.current_index = 0
             player.mediaPlayer.set_media(file_arg)
             player.mediaPlayer.play()